@@ -4,6 +4,8 @@ import numpy as np
 import json
 import plotly.express as px
 import re
+from filter_cache import filter_signature, get_filter_cache
+from review_data import product_key, product_review_stats, rating_distribution, recent_window, RECENT_DAYS
 
 # 2. Page config
 st.set_page_config(page_title="Catalog Dashboard", layout="wide",page_icon="🏠",initial_sidebar_state="expanded")
@@ -57,6 +59,8 @@ df["review_count"] = df["review_count"].astype(int)
 df["avg_rating"] = df["avg_rating"].fillna(0.0)
 df["avg_rating"] = df["avg_rating"].astype(float)
 
+df["product_id"] = df["url"].map(product_key)
+
 # Load Sub_collection_categories.json
 with open("Sub_collection_categories.json", "r", encoding="utf-8") as f:
     subcat_json = json.load(f)
@@ -101,12 +105,41 @@ price_min, price_max = st.sidebar.slider(
 )
 review_min = st.sidebar.slider("Min reviews", 0, int(df["review_count"].max()), (0, 81))
 
-# Filter data
-filtered = df[
-    df["collection"].isin(collections) &
-    df["price"].between(price_min, price_max) &
-    df["review_count"].between(review_min[0], review_min[1])
-]
+# Filter data and derive tables (shared across sessions)
+def compute_filter_results():
+    product_stats = product_review_stats()
+
+    filtered = df[
+        df["collection"].isin(collections) &
+        df["price"].between(price_min, price_max) &
+        df["review_count"].between(review_min[0], review_min[1])
+    ]
+    by_reviews = filtered.sort_values("review_count", ascending=False)
+
+    filtered_stats = product_stats[product_stats["product_id"].isin(filtered["product_id"])]
+    titles = filtered.drop_duplicates("product_id").set_index("product_id")["title"]
+    recent = filtered_stats[filtered_stats["recent_reviews"] > 0].sort_values("recent_reviews", ascending=False).head(5)
+    recent = recent.assign(title=recent["product_id"].astype(str).map(titles))
+
+    return {
+        "index": filtered.index,
+        "most_reviewed": by_reviews.iloc[0],
+        "highest_rated": filtered.sort_values("avg_rating", ascending=False).iloc[0],
+        "top5": by_reviews.head(5),
+        "rating_distribution": rating_distribution(filtered_stats),
+        "recent": recent,
+        "recent_window": recent_window(),
+    }
+
+filter_cache = get_filter_cache()
+results = filter_cache.get_or_compute(
+    filter_signature("home", collections, (price_min, price_max), review_min),
+    compute_filter_results,
+)
+filtered = df.loc[results["index"]]
+
+cache_stats = filter_cache.stats()
+st.sidebar.caption(f"Filter cache: {cache_stats['hit_rate']:.0%} hit rate ({cache_stats['hits']}/{cache_stats['hits'] + cache_stats['misses']})")
 
 #st.data_editor(filtered)
 
@@ -114,9 +147,9 @@ filtered = df[
 col1, col2, col3, col4 = st.columns(4)
 col1.metric("Total Products", len(filtered))
 col2.metric("Average Price", f"₹{filtered['price'].mean():,.0f}")
-most_reviewed = filtered.sort_values("review_count", ascending=False).iloc[0]
+most_reviewed = results["most_reviewed"]
 col3.metric("Most Reviewed", most_reviewed["title"], f"{most_reviewed['review_count']} reviews")
-highest_rated = filtered.sort_values("avg_rating", ascending=False).iloc[0]
+highest_rated = results["highest_rated"]
 col4.metric("Highest Rated", highest_rated["title"], f"{highest_rated['avg_rating']:.1f} ⭐")
 
 st.markdown("---")
@@ -131,7 +164,7 @@ st.plotly_chart(px.bar(bar_data, x="Count", y="Collection", orientation='h', hei
 chart_col, hist_col = st.columns(2)
 with chart_col:
     st.subheader("Top 5 Most Reviewed Products")
-    top5 = filtered.sort_values("review_count", ascending=False).head(5)
+    top5 = results["top5"]
     st.dataframe(top5[["title", "review_count", "avg_rating"]].rename(columns={
         "title": "Product", "review_count": "Reviews", "avg_rating": "Rating"
     }),hide_index=True)
@@ -144,3 +177,17 @@ with hist_col:
     hist.update_layout(xaxis_title=None, yaxis_title=None)
     st.plotly_chart(hist)
 
+
+# 6. Review-level charts
+dist_col, recent_col = st.columns(2)
+with dist_col:
+    st.subheader("Rating Distribution")
+    st.plotly_chart(px.bar(results["rating_distribution"], x="Rating", y="Reviews", template="plotly_white", height=300))
+with recent_col:
+    recent_start, recent_end = results["recent_window"]
+    st.subheader(f"Most Reviewed in the {RECENT_DAYS} Days up to {recent_end:%d %b %Y}")
+    st.caption(f"Window anchored to the newest scraped review: {recent_start:%d %b %Y} – {recent_end:%d %b %Y}")
+    recent = results["recent"]
+    st.dataframe(recent[["title", "recent_reviews", "avg_rating"]].rename(columns={
+        "title": "Product", "recent_reviews": "Reviews", "avg_rating": "Rating"
+    }),hide_index=True)
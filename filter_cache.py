@@ -0,0 +1,107 @@
+import sys
+import threading
+from collections import OrderedDict
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+# Constants
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+def filter_signature(page, selected, *ranges):
+    """
+    Normalize sidebar filter state into a hashable key:
+      - selected options are order-independent
+      - numeric ranges are rounded so float slider noise does not split entries
+    """
+    return (
+        page,
+        tuple(sorted(str(s) for s in selected)),
+        tuple(tuple(round(float(v), 4) for v in r) for r in ranges),
+    )
+
+def _nbytes(value):
+    """Approximate memory footprint of a cached value."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values()) + sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(v) for v in value) + sys.getsizeof(value)
+    return sys.getsizeof(value)
+
+class FilterCache:
+    """Thread-safe LRU of filter results, bounded by approximate memory use."""
+
+    def __init__(self, max_bytes=MAX_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached value for `key`, calling `compute()` on a miss.
+        Concurrent misses on the same key wait for the first caller's result.
+        """
+        while True:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return self._entries[key][0]
+                pending = self._pending.get(key)
+                if pending is None:
+                    self.misses += 1
+                    self._pending[key] = threading.Event()
+                    break
+            # Another session is computing this key; look again once it is done
+            pending.wait()
+
+        # Compute outside the lock so one slow filter does not block other sessions
+        try:
+            value = compute()
+            size = _nbytes(value)
+            with self._lock:
+                if size <= self.max_bytes:
+                    self._entries[key] = (value, size)
+                    self._bytes += size
+                    while self._bytes > self.max_bytes:
+                        _, (_, old_size) = self._entries.popitem(last=False)
+                        self._bytes -= old_size
+                        self.evictions += 1
+        finally:
+            with self._lock:
+                self._pending.pop(key).set()
+        return value
+
+    def stats(self):
+        """Hit/miss counters and current memory use."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+@st.cache_resource
+def get_filter_cache():
+    """One FilterCache per server process, shared by every session."""
+    return FilterCache()
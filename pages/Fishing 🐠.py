@@ -4,6 +4,8 @@ import matplotlib.pyplot as plt
 from wordcloud import WordCloud
 import altair as alt
 import plotly.express as px
+from filter_cache import filter_signature, get_filter_cache
+from review_data import product_key, product_review_stats, sub_collection_review_stats, recent_window, RATINGS, RECENT_DAYS
 
 st.set_page_config(page_title="Fishing Collection Dashboard", layout="wide",initial_sidebar_state="expanded")
 
@@ -14,6 +16,7 @@ def load_data():
     fishing_df = df[df['collection'].str.lower().str.contains("fishing")]
     fishing_df['avg_rating'] = fishing_df['avg_rating'].fillna(0)
     fishing_df['review_count'] = fishing_df['review_count'].fillna(0).astype(int)
+    fishing_df['product_id'] = fishing_df['url'].map(product_key)
     return fishing_df
 
 df = load_data()
@@ -34,18 +37,85 @@ selected_subs = st.sidebar.multiselect("Sub-Collection", sub_collections, defaul
 review_range = st.sidebar.slider("Review Count", 0, int(df['review_count'].max()), (0, 81))
 rating_range = st.sidebar.slider("Rating", 0.0, 5.0, (0.0, 5.0), 0.1)
 
-filtered_df = df[
-    df['sub_collection'].isin(selected_subs) &
-    df['review_count'].between(*review_range) &
-    df['avg_rating'].between(*rating_range)
-]
+# --- Filter and derive tables (shared across sessions) ---
+def compute_filter_results():
+    product_stats = product_review_stats()
+    all_sub_stats = sub_collection_review_stats()
+
+    filtered_df = df[
+        df['sub_collection'].isin(selected_subs) &
+        df['review_count'].between(*review_range) &
+        df['avg_rating'].between(*rating_range)
+    ]
+
+    total_products = len(filtered_df)
+    reviewed_products = (filtered_df['review_count'] > 0).sum()
+
+    sub_reviews = (
+        filtered_df.groupby('sub_collection')['review_count']
+        .sum()
+        .sort_values(ascending=True)
+        .reset_index()
+    )
+
+    sub_metrics = (
+        filtered_df.groupby('sub_collection')
+        .agg(product_count=('title', 'count'), total_reviews=('review_count', 'sum'))
+        .reset_index()
+    )
+    sub_metrics["perct"] = round(((sub_metrics["total_reviews"] / sub_metrics["product_count"])*100 )- 100,2) 
+    sub_metrics["perct"] = sub_metrics["perct"].apply(lambda x: "Reviewed "+ str(x) + "% more" if x >0 else "Reviewed "+ str(x*-1) + "% less")
+
+    chart_data = filtered_df[['title', 'review_count', 'avg_rating']].dropna()
+    worst_df = chart_data[chart_data["review_count"]>0].reset_index(drop=True)
+    worst_df = worst_df[worst_df["avg_rating"]<=3].reset_index(drop=True)
+    worst_df['score'] = (worst_df['review_count'] / (worst_df['avg_rating'] + 1e-6)) + worst_df['review_count'] - (worst_df['avg_rating']*2)
+    worst = worst_df.sort_values(by=['score'], ascending=False).head(8)[['title', 'review_count', 'avg_rating']].reset_index(drop=True)
+
+    titles = filtered_df.drop_duplicates('product_id').set_index('product_id')['title']
+    recent = product_stats[product_stats['product_id'].isin(titles.index) & (product_stats['recent_reviews'] > 0)]
+    recent = recent.sort_values('recent_reviews', ascending=False).head(8)
+    recent = recent.assign(title=recent['product_id'].astype(str).map(titles)).reset_index(drop=True)
+
+    # Word cloud rendering is the slowest filter-dependent step; cache the image pixels
+    text = ' '.join(filtered_df['title'].dropna())
+    wordcloud = WordCloud(width=800, height=300, background_color='white').generate(text).to_array()
+
+    return {
+        "index": filtered_df.index,
+        "total_products": total_products,
+        "reviewed_products": reviewed_products,
+        "review_coverage": reviewed_products / total_products * 100 if total_products else 0,
+        "avg_rating": filtered_df['avg_rating'].mean() if reviewed_products else 0,
+        "most_reviewed": filtered_df.sort_values("review_count", ascending=False).iloc[0] if not filtered_df.empty else None,
+        "sub_reviews": sub_reviews,
+        "sub_metrics": sub_metrics,
+        "chart_data": chart_data,
+        "worst": worst,
+        # Precomputed per sub-collection, so it follows the sub-collection filter only
+        "sub_stats": all_sub_stats[
+            all_sub_stats['collection'].str.lower().str.contains("fishing") &
+            all_sub_stats['sub_collection'].isin(selected_subs)
+        ],
+        "recent": recent,
+        "recent_window": recent_window(),
+        "wordcloud": wordcloud,
+    }
+
+filter_cache = get_filter_cache()
+results = filter_cache.get_or_compute(
+    filter_signature("fishing", selected_subs, review_range, rating_range),
+    compute_filter_results,
+)
+
+cache_stats = filter_cache.stats()
+st.sidebar.caption(f"Filter cache: {cache_stats['hit_rate']:.0%} hit rate ({cache_stats['hits']}/{cache_stats['hits'] + cache_stats['misses']})")
 
 # --- KPI Metrics ---
-total_products = len(filtered_df)
-reviewed_products = (filtered_df['review_count'] > 0).sum()
-review_coverage = reviewed_products / total_products * 100 if total_products else 0
-avg_rating = filtered_df['avg_rating'].mean() if reviewed_products else 0
-most_reviewed = filtered_df.sort_values("review_count", ascending=False).iloc[0] if not filtered_df.empty else None
+total_products = results["total_products"]
+review_coverage = results["review_coverage"]
+avg_rating = results["avg_rating"]
+most_reviewed = results["most_reviewed"]
 
 col1, col2, col3, col4 = st.columns(4)
 col1.metric("TOTAL PRODUCTS", f"{total_products}")
@@ -59,24 +129,13 @@ st.markdown("---")
 col1, col2 = st.columns(2)
 with col1:
     st.subheader("Number of Reviews per Sub-Collection")
-    sub_reviews = (
-        filtered_df.groupby('sub_collection')['review_count']
-        .sum()
-        .sort_values(ascending=True)
-        .reset_index()
-    )
+    sub_reviews = results["sub_reviews"]
     fig_bar = px.bar(sub_reviews, x='review_count', y='sub_collection', orientation='h')
     st.plotly_chart(fig_bar, use_container_width=True)
 
 with col2:
     st.subheader("No. of Products vs Reviews")
-    sub_metrics = (
-        filtered_df.groupby('sub_collection')
-        .agg(product_count=('title', 'count'), total_reviews=('review_count', 'sum'))
-        .reset_index()
-    )
-    sub_metrics["perct"] = round(((sub_metrics["total_reviews"] / sub_metrics["product_count"])*100 )- 100,2) 
-    sub_metrics["perct"] = sub_metrics["perct"].apply(lambda x: "Reviewed "+ str(x) + "% more" if x >0 else "Reviewed "+ str(x*-1) + "% less")
+    sub_metrics = results["sub_metrics"]
     fig_comp = px.scatter(sub_metrics, x='product_count', y='total_reviews', #title='No. of Products vs Reviews',
                           size="total_reviews", color="sub_collection",size_max=30,hover_name='perct',
                           )
@@ -90,12 +149,34 @@ with col2:
     st.plotly_chart(fig_comp, use_container_width=True)
 
 
+# --- Review Ratings ---
+sub_stats = results["sub_stats"]
+
+col1, col2 = st.columns(2)
+with col1:
+    st.subheader("Rating Distribution per Sub-Collection")
+    rating_cols = [f"rating_{r}" for r in RATINGS]
+    sub_ratings = sub_stats.melt(id_vars='sub_collection', value_vars=rating_cols, var_name='rating', value_name='reviews')
+    sub_ratings['rating'] = sub_ratings['rating'].str.replace("rating_", "") + " ⭐"
+    fig_ratings = px.bar(sub_ratings, x='reviews', y='sub_collection', color='rating', orientation='h')
+    st.plotly_chart(fig_ratings, use_container_width=True)
+
+with col2:
+    recent_start, recent_end = results["recent_window"]
+    st.subheader(f"Most Reviewed in the {RECENT_DAYS} Days up to {recent_end:%d %b %Y}")
+    st.caption(f"Window anchored to the newest scraped review: {recent_start:%d %b %Y} – {recent_end:%d %b %Y}")
+    recent = results["recent"]
+    st.table(recent[['title', 'recent_reviews', 'avg_rating']].rename(columns={
+        'title': 'Product Title',
+        'recent_reviews': 'Reviews',
+        'avg_rating': 'Avg Rating'
+    }))
+
+
 # --- Word Cloud ---
 st.subheader("Common Words in Product Titles")
-text = ' '.join(filtered_df['title'].dropna())
-wc = WordCloud(width=800, height=300, background_color='white').generate(text)
 fig, ax = plt.subplots(figsize=(10, 3))
-ax.imshow(wc, interpolation='bilinear')
+ax.imshow(results["wordcloud"], interpolation='bilinear')
 ax.axis('off')
 st.pyplot(fig)
 
@@ -104,7 +185,7 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("Engagement vs Satisfaction")
-    chart_data = filtered_df[['title', 'review_count', 'avg_rating']].dropna()
+    chart_data = results["chart_data"]
     #st.dataframe(chart_data)
     st.altair_chart(
         alt.Chart(chart_data).mark_circle(size=60).encode(
@@ -118,11 +199,7 @@ with col1:
 
 with col2:
     st.subheader("Worst Performing Products")
-    worst_df = chart_data.copy()
-    worst_df = worst_df[worst_df["review_count"]>0].reset_index(drop=True)
-    worst_df = worst_df[worst_df["avg_rating"]<=3].reset_index(drop=True)
-    worst_df['score'] = (worst_df['review_count'] / (worst_df['avg_rating'] + 1e-6)) + worst_df['review_count'] - (worst_df['avg_rating']*2)
-    worst = worst_df.sort_values(by=['score'], ascending=False).head(8)[['title', 'review_count', 'avg_rating']].reset_index(drop=True)
+    worst = results["worst"]
     st.table(worst.rename(columns={
         'title': 'Product Title',
         'review_count': 'Reviews',
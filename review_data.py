@@ -0,0 +1,138 @@
+import json
+import streamlit as st
+import pandas as pd
+
+# Constants
+CATALOG_JSON = "cabral_full_catalog_with_ratings.json"
+SUB_COLLECTIONS_JSON = "Sub_collection_categories.json"
+RATINGS = [1, 2, 3, 4, 5]
+RECENT_DAYS = 90
+
+def product_key(url):
+    """
+    Stable product id: the handle after /products/ in a product url.
+    The same product listed in two sub-collections has two urls but one handle.
+    """
+    if not isinstance(url, str):
+        return None
+    return url.split("/products/")[-1].split("?")[0].strip("/")
+
+def _load_catalog(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+# 1. Flatten Judge.me reviews into a columnar table
+@st.cache_data
+def load_reviews(path=CATALOG_JSON):
+    """
+    Flatten product["reviews"] from the catalog JSON into one row per review:
+      - product_id (product handle, see product_key)
+      - rating (int8)
+      - created_at (UTC timestamp)
+      - body_len
+      - has_image
+    A product listed under several sub-collections is only counted once.
+    """
+    raw = _load_catalog(path)
+
+    product_ids, ratings, created, body_lens, has_images = [], [], [], [], []
+    seen = set()
+    for group in raw.values():
+        for sub in group.get("subs", {}).values():
+            for prod in sub.get("products", []):
+                pid = product_key(prod.get("url"))
+                if not pid or pid in seen:
+                    continue
+                seen.add(pid)
+                for review in prod.get("reviews") or []:
+                    product_ids.append(pid)
+                    ratings.append(review.get("rating"))
+                    created.append(review.get("created_at"))
+                    body_lens.append(len(review.get("body") or ""))
+                    has_images.append(bool(review.get("image_urls")))
+
+    reviews = pd.DataFrame({
+        "product_id": pd.Categorical(product_ids),
+        "rating": pd.to_numeric(pd.Series(ratings, dtype="object"), errors="coerce"),
+        "created_at": pd.to_datetime(pd.Series(created, dtype="object").str.replace(" UTC", "", regex=False), errors="coerce", utc=True),
+        "body_len": pd.Series(body_lens, dtype="int32"),
+        "has_image": pd.Series(has_images, dtype="bool"),
+    })
+    reviews = reviews.dropna(subset=["rating"])
+    reviews["rating"] = reviews["rating"].clip(1, 5).astype("int8")
+    return reviews.reset_index(drop=True)
+
+@st.cache_data
+def load_sub_collection_membership(path=CATALOG_JSON, categories_path=SUB_COLLECTIONS_JSON):
+    """Product id -> (collection, sub_collection), using the same sub_title mapping as the Home page."""
+    with open(categories_path, "r", encoding="utf-8") as f:
+        subcat_json = json.load(f)
+    sub_title_to_parent = {}
+    for category in subcat_json.values():
+        for sub_title in category["subs"].values():
+            sub_title_to_parent[sub_title] = category["title"]
+
+    rows = []
+    for group in _load_catalog(path).values():
+        for sub in group.get("subs", {}).values():
+            sub_collection = sub_title_to_parent.get(sub.get("title"), "Unknown")
+            for prod in sub.get("products", []):
+                pid = product_key(prod.get("url"))
+                if pid:
+                    rows.append((pid, group.get("title"), sub_collection))
+    return pd.DataFrame(rows, columns=["product_id", "collection", "sub_collection"]).drop_duplicates()
+
+# 2. Precompute rating histograms and review velocity
+def recent_cutoff(reviews, window_days=RECENT_DAYS):
+    """
+    Start of the "recent" window. Anchored to the newest review in the full
+    table, not today, so a stale scrape still ranks and every view shares one window.
+    """
+    return reviews["created_at"].max() - pd.Timedelta(days=window_days)
+
+@st.cache_data
+def recent_window(window_days=RECENT_DAYS):
+    """(start, end) of the "recent" window, for labelling it in the UI."""
+    reviews = load_reviews()
+    return recent_cutoff(reviews, window_days), reviews["created_at"].max()
+
+def _review_stats(reviews, keys, cutoff):
+    """Rating histogram, average and recent review count grouped by `keys`."""
+    hist = (
+        reviews.groupby(keys + ["rating"], observed=True)
+        .size()
+        .unstack("rating", fill_value=0)
+        .reindex(columns=RATINGS, fill_value=0)
+    )
+    hist.columns = [f"rating_{r}" for r in RATINGS]
+
+    grouped = reviews.assign(recent=reviews["created_at"] >= cutoff).groupby(keys, observed=True)
+    stats = grouped.agg(
+        total_reviews=("rating", "size"),
+        avg_rating=("rating", "mean"),
+        recent_reviews=("recent", "sum"),
+        with_images=("has_image", "sum"),
+        last_review=("created_at", "max"),
+    )
+    return stats.join(hist).reset_index()
+
+@st.cache_data
+def product_review_stats(window_days=RECENT_DAYS):
+    """Per-product rating histogram and review velocity."""
+    reviews = load_reviews()
+    return _review_stats(reviews, ["product_id"], recent_cutoff(reviews, window_days))
+
+@st.cache_data
+def sub_collection_review_stats(window_days=RECENT_DAYS):
+    """
+    Per-sub-collection rating histogram and review velocity, precomputed for
+    every (collection, sub_collection); pages select the rows they show.
+    """
+    reviews = load_reviews()
+    joined = reviews.assign(product_id=reviews["product_id"].astype(str)).merge(load_sub_collection_membership(), on="product_id")
+    return _review_stats(joined, ["collection", "sub_collection"], recent_cutoff(reviews, window_days))
+
+def rating_distribution(stats):
+    """Long-format rating counts from a stats table, ready for plotting."""
+    hist = stats[[f"rating_{r}" for r in RATINGS]].sum()
+    return pd.DataFrame({"Rating": [f"{r} ⭐" for r in RATINGS], "Reviews": hist.values})